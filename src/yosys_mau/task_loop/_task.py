@@ -6,12 +6,12 @@ import functools
 import gc
 import inspect
 import signal
+import types
 import typing
-from contextlib import contextmanager
-from contextvars import ContextVar
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar, Token
 from dataclasses import dataclass
-from itertools import count
-from typing import Any, Awaitable, Callable, Generic, Iterator, Literal
+from typing import Any, Awaitable, Callable, Generic, Literal
 
 from typing_extensions import ParamSpec, Self
 
@@ -25,14 +25,42 @@ Args = ParamSpec("Args")
 
 _current_task: ContextVar[Task] = ContextVar(f"{__name__}._current_task")
 
+_already_current_task_ctx: typing.ContextManager[None] = nullcontext()
 
-@contextmanager
-def set_current_task(task: Task) -> typing.Iterator[None]:
-    token = _current_task.set(task)
-    try:
-        yield
-    finally:
-        _current_task.reset(token)
+
+class _CurrentTaskCtx:
+    """Context manager that temporarily overrides the current task.
+
+    Used instead of a `contextmanager` generator as it is entered for every state change, event
+    emission and cancellation. Each task keeps a single instance that supports nested use.
+    """
+
+    __slots__ = ("_task", "_tokens")
+
+    def __init__(self, task: Task) -> None:
+        self._task = task
+        self._tokens: list[Token[Task]] = []
+
+    def __enter__(self) -> None:
+        self._tokens.append(_current_task.set(self._task))
+
+    def __exit__(self, *args: Any) -> None:
+        tokens = self._tokens
+        token = tokens.pop()
+        try:
+            _current_task.reset(token)
+        except ValueError:
+            # The same instance was entered from an interleaved asyncio task, so the most recent
+            # token belongs to a different context. Find the one created in this context.
+            tokens.append(token)
+            for i in range(len(tokens) - 1, -1, -1):
+                try:
+                    _current_task.reset(tokens[i])
+                except ValueError:
+                    continue
+                del tokens[i]
+                return
+            raise
 
 
 class TaskLoopError(RuntimeError):
@@ -46,18 +74,15 @@ def current_task() -> Task:
 
     :raises TaskLoopError: if no task is currently active
     """
-    try:
-        return _current_task.get()
-    except LookupError:
-        raise TaskLoopError("no task is currently active") from None
+    task = _current_task.get(None)
+    if task is None:
+        raise TaskLoopError("no task is currently active")
+    return task
 
 
 def current_task_or_none() -> Task | None:
     """Return the currently active task or None if no task is active."""
-    try:
-        return _current_task.get()
-    except LookupError:
-        pass
+    return _current_task.get(None)
 
 
 def task_loop() -> TaskLoop:
@@ -76,6 +101,9 @@ TaskState = Literal[
 
 
 def as_awaitable(fn: Callable[Args, T | Awaitable[T]]) -> Callable[Args, Awaitable[T]]:
+    if inspect.iscoroutinefunction(fn):
+        return fn  # type: ignore
+
     def wrapper(*args: Args.args, **kwargs: Args.kwargs) -> Awaitable[T]:
         result = fn(*args, **kwargs)
         if not isinstance(result, Awaitable):
@@ -89,27 +117,63 @@ def as_awaitable(fn: Callable[Args, T | Awaitable[T]]) -> Callable[Args, Awaitab
     return wrapper
 
 
+def _has_parameters(fn: Callable[..., Any]) -> bool:
+    """Equivalent to ``bool(inspect.signature(fn).parameters)``, but avoids the full signature
+    introspection for plain functions and methods."""
+    func, bound = fn, 0
+    if type(func) is types.MethodType:
+        func, bound = func.__func__, 1
+    if type(func) is types.FunctionType and not func.__dict__:
+        code = func.__code__
+        if code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS):
+            return True
+        return code.co_argcount + code.co_kwonlyargcount > bound
+    return bool(inspect.signature(fn).parameters)
+
+
+def _resolve_future(future: asyncio.Future[None], outcome: bool | BaseException | None) -> None:
+    """Resolves a future according to a task outcome as tracked by `Task`."""
+    if outcome is None:
+        return
+    elif outcome is True:
+        future.set_result(None)
+    elif outcome is False:
+        future.cancel()
+    else:
+        assert isinstance(outcome, BaseException)
+        future.set_exception(outcome)
+        future.exception()
+
+
 global_task_loop: TaskLoop | None = None
 
 
 class TaskLoop:
+    loop: asyncio.AbstractEventLoop
     root_task: RootTask
-    task_eq_ids: Iterator[int]
+    subscribed_event_types: set[type]
+    """Event types any task ever subscribed to, used to skip emitting events nobody listens to."""
+    emit_state_changes: bool
+    """Whether any subscribed event type covers `TaskStateChange` events."""
 
     def __init__(
         self,
         on_run: Callable[[], None | Awaitable[None]],
         *,
         handle_sigint: bool = True,
+        force_gc: bool = True,
     ) -> None:
         global global_task_loop
         if global_task_loop is not None:
             raise TaskLoopError("a task loop is already installed")
         global_task_loop = self
+        self.subscribed_event_types = set()
+        self.emit_state_changes = False
 
         async def wrapper():
+            self.loop = asyncio.get_running_loop()
             if handle_sigint:
-                asyncio.get_event_loop().add_signal_handler(signal.SIGINT, self._handle_sigint)
+                self.loop.add_signal_handler(signal.SIGINT, self._handle_sigint)
             job.global_client()  # early setup of the job server client
 
             RootTask(on_run=on_run)
@@ -125,7 +189,8 @@ class TaskLoop:
             # Some __del__ implementations in the stdlib expect the event loop to be still running
             # and cause ignored exception warnings when they are cycle collected after the event
             # loop exited. Manually triggering a cycle collection fixes this.
-            gc.collect()
+            if force_gc:
+                gc.collect()
 
         try:
             exception = asyncio.run(wrapper())
@@ -134,24 +199,35 @@ class TaskLoop:
         finally:
             global_task_loop = None
 
+    def _subscribe_event_type(self, event_type: type) -> None:
+        self.subscribed_event_types.add(event_type)
+        if issubclass(TaskStateChange, event_type):
+            self.emit_state_changes = True
+
     def _handle_sigint(self) -> None:
         with self.root_task.as_current_task():
             TaskLoopInterrupted().emit()
         self.root_task.cancel()
-        asyncio.get_event_loop().remove_signal_handler(signal.SIGINT)
+        self.loop.remove_signal_handler(signal.SIGINT)
 
 
 def run_task_loop(
-    on_run: Callable[[], None | Awaitable[None]], *, handle_sigint: bool = True
+    on_run: Callable[[], None | Awaitable[None]],
+    *,
+    handle_sigint: bool = True,
+    force_gc: bool = True,
 ) -> None:
     """Run the task loop.
 
     :param on_run: The function (async or sync) to run in the context of the task loop's root task.
     :param handle_sigint: Whether to handle SIGINT (Ctrl+C) by cancelling the root task (recursively
         cancelling all child tasks).
+    :param force_gc: Whether to run a full garbage collection before the event loop exits. This
+        can be slow for programs with large object graphs, but disabling it can cause warnings about
+        ignored exceptions in ``__del__`` methods of stdlib objects that are collected later.
 
     """
-    TaskLoop(on_run, handle_sigint=handle_sigint)
+    TaskLoop(on_run, handle_sigint=handle_sigint, force_gc=force_gc)
 
 
 class ContextProxy(Generic[T]):
@@ -192,40 +268,104 @@ class Task:
     the constructor.
     """
 
+    __slots__ = (
+        "__name",
+        "__path",
+        "_parent",
+        "__children",
+        "__child_names",
+        "__child_name_suffixes",
+        "__dependencies",
+        "__pending_dependencies",
+        "__pending_children",
+        "__reverse_dependencies",
+        "__error_handlers",
+        "__state",
+        "__loop",
+        "__aio_main_task",
+        "__aio_background_tasks",
+        "__aio_wait_background_tasks",
+        "__background_task_counter",
+        "__block_finish_counter",
+        "__started",
+        "__finished",
+        "__started_outcome",
+        "__finished_outcome",
+        "__event_channels",
+        "__event_sync_handlers",
+        "__use_lease",
+        "__lease",
+        "__cleaned_up",
+        "__cancelled_by",
+        "__cancellation_cause",
+        "__current_task_ctx",
+        "discard",
+        "_context_values",
+        "_context_cache",
+        # Instances can override ``on_*`` and other methods by assignment, and tasks remain weakly
+        # referenceable as they were before using slots.
+        "__dict__",
+        "__weakref__",
+    )
+
     __name: str
-    __parent: Task | None
-    __children: StableSet[Task]
+    __path: str | None
+    _parent: Task | None
+    """Same as `parent`. `TaskContextDescriptor` reads this directly to avoid a property call for
+    every step up the task hierarchy."""
+    __children: dict[Task, None]
     __child_names: set[str]
+    __child_name_suffixes: dict[str, int]
 
-    __dependencies: StableSet[Task]
-    __pending_dependencies: dict[Task, Callable[..., Any]]
-    __pending_children: dict[Task, Callable[..., Any]]
+    __dependencies: dict[Task, None]
+    __pending_dependencies: dict[asyncio.Future[None], Task]
+    __pending_children: dict[asyncio.Future[None], Task]
 
-    __reverse_dependencies: StableSet[Task]
+    __reverse_dependencies: dict[Task, None]
 
     __error_handlers: dict[Task | None, Callable[[BaseException], None]]
 
     __state: TaskState
 
+    __loop: asyncio.AbstractEventLoop
     __aio_main_task: asyncio.Task[None]
-    __aio_background_tasks: StableSet[asyncio.Task[None]]
-    __aio_wait_background_tasks: StableSet[asyncio.Task[None]]
+    __aio_background_tasks: dict[asyncio.Task[None], None]
+    __aio_wait_background_tasks: dict[asyncio.Task[None], None]
     __background_task_counter: int
 
     __block_finish_counter: int
 
-    __started: asyncio.Future[None]
-    __finished: asyncio.Future[None]
+    # Created lazily, only when something awaits or watches them. Until then (and in addition) the
+    # outcome is tracked as ``None`` while pending, ``True`` on success, ``False`` when cancelled or
+    # as the exception the task failed with.
+    __started: asyncio.Future[None] | None
+    __finished: asyncio.Future[None] | None
+    __started_outcome: bool | BaseException | None
+    __finished_outcome: bool | BaseException | None
 
-    __event_cursors: dict[type, asyncio.Future[TaskEventCursor[Any]]]
+    __event_channels: dict[type, _EventChannel[Any]]
     __event_sync_handlers: dict[type, StableSet[Callable[[Any], None]]]
 
     __use_lease: bool
     __lease: job.Lease | None
 
+    __cleaned_up: bool
+
     __cancelled_by: Task | None
     __cancellation_cause: BaseException | None
 
+    __current_task_ctx: _CurrentTaskCtx
+
+    _context_values: dict[Any, Any] | None
+    """Values of task context variables set for this task, keyed by their `TaskContextDescriptor`.
+
+    Created on the first assignment.
+    """
+
+    _context_cache: dict[Any, tuple[int, Any]] | None
+    """Task context variable values resolved for this task, along with the version of the variable
+    they were resolved for. Managed by `TaskContextDescriptor`."""
+
     discard: bool
     """If set to, the task will be discarded (automatically cancelled) when the last of the
     tasks depending on it finishes (by failure or cancellation).
@@ -259,7 +399,7 @@ class Task:
     @property
     def parent(self) -> Task | None:
         """The parent task of this task, or `None` if this is the root task."""
-        return self.__parent
+        return self._parent
 
     @property
     def state(self) -> TaskState:
@@ -289,22 +429,36 @@ class Task:
             self.__set_name(name)
             return
 
-        if self.__name:
-            self.parent.__child_names.remove(self.__name)
+        child_names = self.parent.__child_names
+        suffixes = self.parent.__child_name_suffixes
 
-        if name not in self.parent.__child_names:
+        if self.__name:
+            child_names.remove(self.__name)
+            base, sep, suffix = self.__name.rpartition("#")
+            # Only suffixes that the loop below can produce free up a slot for it.
+            if sep and suffix.isdecimal() and suffix == str(int(suffix)):
+                index = int(suffix)
+                if 1 <= index < suffixes.get(base, 0):
+                    suffixes[base] = index
+
+        if name not in child_names:
             self.__set_name(name)
-            self.parent.__child_names.add(name)
+            child_names.add(name)
             return
 
-        for i in count(1):
-            if (unique_name := f"{name}#{i}") not in self.parent.__child_names:
-                self.__set_name(unique_name)
-                self.parent.__child_names.add(unique_name)
-                break
+        # Continue from the last suffix used for this name instead of probing from 1 each time. It
+        # is lowered again when a task with a suffixed name is renamed, so this still picks the
+        # lowest unused suffix.
+        i = suffixes.get(name, 1)
+        while (unique_name := f"{name}#{i}") in child_names:
+            i += 1
+        suffixes[name] = i + 1
+        self.__set_name(unique_name)
+        child_names.add(unique_name)
 
     def __set_name(self, name: str):
         self.__name = name
+        self.__invalidate_path()
         # if self.parent:
         #     self.__aio_main_task.set_name(f"{name} main")
 
@@ -315,9 +469,21 @@ class Task:
         Lists the names of the path from the containing top-level task to this task, separated by
         dots.
         """
-        if self.parent and self.parent.parent:
-            return f"{self.parent.path}.{self.name}"
-        return self.name
+        if self.__path is None:
+            if self._parent and self._parent._parent:
+                self.__path = f"{self._parent.path}.{self.__name}"
+            else:
+                self.__path = self.__name
+        return self.__path
+
+    def __invalidate_path(self) -> None:
+        # A cached path implies cached paths for all ancestors, so we can stop at the first task
+        # without one.
+        if self.__path is None:
+            return
+        self.__path = None
+        for child in self.__children:
+            child.__invalidate_path()
 
     def __str__(self) -> str:
         return self.path
@@ -342,64 +508,77 @@ class Task:
             alternative to subclassing `Task` and overriding `on_prepare`.
         """
         if on_run is not None:
-            if inspect.signature(on_run).parameters:
+            if _has_parameters(on_run):
                 on_run = functools.partial(on_run, self)
             self.on_run = as_awaitable(on_run)  # type: ignore
         if on_prepare is not None:
-            if inspect.signature(on_prepare).parameters:
+            if _has_parameters(on_prepare):
                 on_prepare = functools.partial(on_prepare, self)
             self.on_prepare = as_awaitable(on_prepare)  # type: ignore
 
         self.__name = ""
+        self.__path = None
         self.__state = "preparing"
-        self.__children = StableSet()
+        self.__children = {}
         self.__child_names = set()
-        self.__dependencies = StableSet()
+        self.__child_name_suffixes = {}
+        self.__dependencies = {}
         self.__pending_dependencies = {}
         self.__pending_children = {}
-        self.__reverse_dependencies = StableSet()
+        self.__reverse_dependencies = {}
         self.__error_handlers = {}
-        self.__started = asyncio.Future()
-        self.__finished = asyncio.Future()
+        self.__started = None
+        self.__finished = None
+        self.__started_outcome = None
+        self.__finished_outcome = None
         self.__use_lease = False
         self.__lease = None
         self.__cleaned_up = False
-        self.__aio_background_tasks = StableSet()
-        self.__aio_wait_background_tasks = StableSet()
+        self.__aio_background_tasks = {}
+        self.__aio_wait_background_tasks = {}
         self.__background_task_counter = 0
-        self.__event_cursors = {}
+        self.__event_channels = {}
         self.__event_sync_handlers = {}
         self.__cancelled_by = None
         self.__cancellation_cause = None
         self.__block_finish_counter = 0
+        self.__current_task_ctx = _CurrentTaskCtx(self)
 
         self.discard = True
+        self._context_values = None
+        self._context_cache = None
 
-        if isinstance(self, RootTask):
-            self.__parent = None
+        parent = current_task_or_none()
+        if parent is None:
+            # Only the root task is created without a current task.
             loop = task_loop()
-            assert not hasattr(loop, "root_task")
-            task_loop().root_task = self
+            if hasattr(loop, "root_task"):
+                raise TaskLoopError("no task is currently active")
+            assert isinstance(self, RootTask)
+            self._parent = None
+            loop.root_task = self
+            self.__loop = loop.loop
         else:
-            self.__parent = current_task()
+            self._parent = parent
+            self.__loop = parent.__loop
 
             assert (
-                self.__parent.state == "running"
+                self._parent.state == "running"
             ), "cannot create child tasks before the parent task is running"
             # TODO allow this but make children block for their parent having started
 
-            self.__parent.__add_child(self)
+            self._parent.__add_child(self)
 
         self.name = self.__class__.__name__ if name is None else name
 
-        self.__aio_main_task = asyncio.create_task(self.__task_main(), name=f"{self.name} main")
+        self.__aio_main_task = self.__loop.create_task(self.__task_main(), name=f"{self.name} main")
 
     def __change_state(self, new_state: TaskState) -> None:
         if self.__state == new_state:
             return
         old_state, self.__state = self.__state, new_state
-        if self.__parent:
-            with self.as_current_task():
+        if self._parent and task_loop().emit_state_changes:
+            with self.__as_current_task_now():
                 TaskStateChange(old_state, new_state).emit()
 
     def depends_on(self, task: Task) -> None:
@@ -408,12 +587,14 @@ class Task:
             "preparing",
             "pending",
         ), "cannot add dependencies after task has started"
-        self.__dependencies.add(task)
+        self.__dependencies[task] = None
         if task.state in ("preparing", "pending", "running"):
-            callback: Callable[[Any], None] = lambda _: self.__dependency_finished(task)
-            task.__finished.add_done_callback(callback)
-            self.__pending_dependencies[task] = callback
-            task.__reverse_dependencies.add(self)
+            finished = task.__finished_future()
+            if finished in self.__pending_dependencies:
+                return
+            finished.add_done_callback(self.__dependency_finished)
+            self.__pending_dependencies[finished] = task
+            task.__reverse_dependencies[self] = None
 
     def set_error_handler(
         self, task: Task | None, handler: Callable[[BaseException], None]
@@ -444,19 +625,19 @@ class Task:
 
     def __add_child(self, task: Task) -> None:
         assert self.state == "running", "children can only be added to a running tasks"
-        self.__children.add(task)
+        self.__children[task] = None
         if task.state in ("preparing", "pending", "running"):
-            callback: Callable[[Any], None] = lambda _: self.__child_finished(task)
-            task.__finished.add_done_callback(callback)
-            self.__pending_children[task] = callback
+            finished = task.__finished_future()
+            finished.add_done_callback(self.__child_finished)
+            self.__pending_children[finished] = task
 
-    def __dependency_finished(self, task: Task) -> None:
-        self.__pending_dependencies.pop(task)
+    def __dependency_finished(self, finished: asyncio.Future[None]) -> None:
+        task = self.__pending_dependencies.pop(finished)
         self.__propagate_failure(task, (DependencyFailed, DependencyCancelled))
         self.__check_start()
 
-    def __child_finished(self, task: Task) -> None:
-        self.__pending_children.pop(task)
+    def __child_finished(self, finished: asyncio.Future[None]) -> None:
+        task = self.__pending_children.pop(finished)
         self.__propagate_failure(task, (ChildFailed, ChildCancelled))
         self.__check_finish()
 
@@ -474,7 +655,7 @@ class Task:
             if not self.__lease.ready:
                 self.__lease.add_ready_callback(self.__check_start)
                 return
-        self.__started.set_result(None)
+        self.__set_started(True)
 
     def __check_finish(self) -> None:
         if self.state != "waiting":
@@ -485,7 +666,7 @@ class Task:
             return
         if self.__block_finish_counter:
             return
-        self.__finished.set_result(None)
+        self.__set_finished(True)
 
     def __propagate_failure(
         self,
@@ -494,13 +675,10 @@ class Task:
         exception: BaseException | None = None,
     ) -> None:
         if exception is None:
-            try:
-                exception = task.__finished.exception()
-            except asyncio.CancelledError as exc:
-                exception = exc
-
-            if exception is None:
+            outcome = task.__finished_outcome
+            if outcome is None or outcome is True:
                 return
+            exception = asyncio.CancelledError() if outcome is False else outcome
 
         wrap_failed, wrap_cancelled = wrap
 
@@ -534,17 +712,20 @@ class Task:
     async def __task_main(self) -> None:
         __prev_task = _current_task.set(self)
         try:
-            TaskStateChange(None, self.__state).emit()
+            if task_loop().emit_state_changes:
+                TaskStateChange(None, self.__state).emit()
             await self.on_prepare()
             self.__change_state("pending")
             self.__check_start()
-            await self.started
+            if self.__started_outcome is not True:
+                await self.started
             self.__change_state("running")
             await self.on_run()
             self.__lease = None
             self.__change_state("waiting")
             self.__check_finish()
-            await self.finished
+            if self.__finished_outcome is not True:
+                await self.finished
             self.__change_state("done")
         except Exception as exc:
             self.__failed(exc)
@@ -559,14 +740,17 @@ class Task:
         self.on_cleanup()
         self.__lease = None
 
-        for task, callback in self.__pending_children.items():
-            task.__finished.remove_done_callback(callback)
+        # A done future already scheduled its callbacks, so there is nothing left to remove.
+        for finished in self.__pending_children:
+            if not finished.done():
+                finished.remove_done_callback(self.__child_finished)
 
-        for task, callback in self.__pending_dependencies.items():
-            task.__finished.remove_done_callback(callback)
-            task.__reverse_dependencies.remove(self)
+        for finished, task in self.__pending_dependencies.items():
+            if not finished.done():
+                finished.remove_done_callback(self.__dependency_finished)
+            del task.__reverse_dependencies[self]
             if not task.__reverse_dependencies and task.discard:
-                asyncio.get_event_loop().call_soon(lambda: task.__cancel(discard=True))
+                self.__loop.call_soon(functools.partial(task.__cancel, discard=True))
 
         for aio_task in self.__aio_background_tasks:
             aio_task.cancel()
@@ -574,8 +758,8 @@ class Task:
         for aio_task in self.__aio_wait_background_tasks:
             aio_task.cancel()
 
-        for cursor in self.__event_cursors.values():
-            cursor.cancel()
+        for channel in self.__event_channels.values():
+            channel.close()
 
         self.__aio_main_task.cancel()
         if asyncio.current_task() == self.__aio_main_task:
@@ -589,12 +773,8 @@ class Task:
             return
 
         self.__lease = None
-        if not self.__started.done():
-            self.__started.set_exception(exc)
-            self.__started.exception()
-        if not self.__finished.done():
-            self.__finished.set_exception(exc)
-            self.__finished.exception()
+        self.__set_started(exc)
+        self.__set_finished(exc)
         self.__change_state("failed")
 
         if self.__children:
@@ -632,7 +812,7 @@ class Task:
     async def started(self) -> None:
         """Awaitable that resolves when the task has started running."""
         try:
-            await asyncio.shield(self.__started)
+            await asyncio.shield(self.__started_future())
         except asyncio.CancelledError:
             raise TaskCancelled(self) from self.__cancellation_cause
         except BaseException as exc:
@@ -645,12 +825,38 @@ class Task:
         This includes successful completion, cancellations and failure.
         """
         try:
-            await asyncio.shield(self.__finished)
+            await asyncio.shield(self.__finished_future())
         except asyncio.CancelledError:
             raise TaskCancelled(self) from self.__cancellation_cause
         except BaseException as exc:
             raise TaskFailed(self) from exc
 
+    def __started_future(self) -> asyncio.Future[None]:
+        if self.__started is None:
+            self.__started = self.__loop.create_future()
+            _resolve_future(self.__started, self.__started_outcome)
+        return self.__started
+
+    def __finished_future(self) -> asyncio.Future[None]:
+        if self.__finished is None:
+            self.__finished = self.__loop.create_future()
+            _resolve_future(self.__finished, self.__finished_outcome)
+        return self.__finished
+
+    def __set_started(self, outcome: bool | BaseException) -> None:
+        if self.__started_outcome is not None:
+            return
+        self.__started_outcome = outcome
+        if self.__started is not None:
+            _resolve_future(self.__started, outcome)
+
+    def __set_finished(self, outcome: bool | BaseException) -> None:
+        if self.__finished_outcome is not None:
+            return
+        self.__finished_outcome = outcome
+        if self.__finished is not None:
+            _resolve_future(self.__finished, outcome)
+
     @property
     def is_finished(self) -> bool:
         """Whether the task has finished running.
@@ -689,10 +895,8 @@ class Task:
             return
 
         self.__cancellation_cause = cause
-        if not self.__started.done():
-            self.__started.cancel()
-        if not self.__finished.done():
-            self.__finished.cancel()
+        self.__set_started(False)
+        self.__set_finished(False)
 
         self.__change_state("discarded" if discard else "cancelled")
 
@@ -703,7 +907,7 @@ class Task:
                 child.__cancel(discard=discard, cause=cause)
 
         try:
-            with self.as_current_task():
+            with self.__as_current_task_now():
                 self.on_cancel()
         finally:
             self.__cleanup()
@@ -750,64 +954,65 @@ class Task:
         ), "background handlers can only be created for running or waiting tasks"
         target_coroutine = as_awaitable(target)
 
-        aio_task = None
-
         if error_handler and self.is_finished:
             wait = False
 
-        async def wrapper():
-            nonlocal aio_task
-            __prev_task = _current_task.set(self)
-            try:
-                await target_coroutine()
-            except asyncio.CancelledError:
-                pass
-            except BaseException as e:
-                self.__failed(e)
-            finally:
-                _current_task.reset(__prev_task)
-                if aio_task is not None:
-                    if wait:
-                        self.__aio_wait_background_tasks.remove(aio_task)
-                        self.__check_finish()
-                    else:
-                        self.__aio_background_tasks.discard(aio_task)
-
         self.__background_task_counter += 1
-        aio_task = asyncio.create_task(
-            wrapper(), name=f"{self.name} background {self.__background_task_counter}"
+        aio_task = self.__loop.create_task(
+            self.__background_main(target_coroutine),
+            name=f"{self.name} background {self.__background_task_counter}",
         )
 
         if error_handler and self.is_finished:
             return aio_task
 
         if wait:
-            self.__aio_wait_background_tasks.add(aio_task)
+            self.__aio_wait_background_tasks[aio_task] = None
+            aio_task.add_done_callback(self.__wait_background_finished)
         else:
-            self.__aio_background_tasks.add(aio_task)
+            self.__aio_background_tasks[aio_task] = None
+            aio_task.add_done_callback(self.__background_finished)
 
         return aio_task
 
+    async def __background_main(self, target: Callable[[], Awaitable[None]]) -> None:
+        __prev_task = _current_task.set(self)
+        try:
+            await target()
+        except asyncio.CancelledError:
+            pass
+        except BaseException as e:
+            self.__failed(e)
+        finally:
+            _current_task.reset(__prev_task)
+
+    def __background_finished(self, aio_task: asyncio.Task[None]) -> None:
+        self.__aio_background_tasks.pop(aio_task, None)
+
+    def __wait_background_finished(self, aio_task: asyncio.Task[None]) -> None:
+        del self.__aio_wait_background_tasks[aio_task]
+        self.__check_finish()
+
     def __emit_event__(self, event: TaskEvent) -> None:
         assert event.source is self
 
+        event_mro = type(event).__mro__
+        if task_loop().subscribed_event_types.isdisjoint(event_mro):
+            return
+
         current = self
 
         while current is not None:
-            for mro_item in type(event).mro():
+            for mro_item in event_mro:
                 sync_handlers = current.__event_sync_handlers.get(mro_item, ())
                 for handler in list(sync_handlers):
                     handler(event)
 
-                cursor = current.__event_cursors.get(mro_item)
-                if cursor is None:
-                    continue
-
-                next_cursor: asyncio.Future[TaskEventCursor[Any]] = asyncio.Future()
-                cursor.set_result(TaskEventCursor(event, next_cursor))
-                current.__event_cursors[mro_item] = next_cursor
+                channel = current.__event_channels.get(mro_item)
+                if channel is not None:
+                    channel.send(event)
 
-            current = current.__parent
+            current = current._parent
 
     def events(
         self, event_type: type[T_TaskEvent], where: Callable[[T_TaskEvent], bool] | None = None
@@ -820,10 +1025,11 @@ class Task:
         Note that using ``event_type`` is more efficient than a ``where`` predicate that uses
         `isinstance`.
         """
-        if event_type not in self.__event_cursors:
-            self.__event_cursors[event_type] = asyncio.Future()
-        cursor = self.__event_cursors[event_type]
-        return TaskEventStream(cursor, where or (lambda _: True))
+        channel = self.__event_channels.get(event_type)
+        if channel is None:
+            channel = self.__event_channels[event_type] = _EventChannel(self.__loop)
+            task_loop()._subscribe_event_type(event_type)
+        return TaskEventStream(channel, where or (lambda _: True))
 
     def sync_handle_events(
         self,
@@ -841,10 +1047,11 @@ class Task:
         """
         if event_type not in self.__event_sync_handlers:
             self.__event_sync_handlers[event_type] = StableSet()
+            task_loop()._subscribe_event_type(event_type)
 
         def wrapper(event: T_TaskEvent):
             try:
-                with self.as_current_task():
+                with self.__as_current_task_now():
                     handler(event)
             except BaseException as exc:
                 self.__failed(exc)
@@ -859,7 +1066,15 @@ class Task:
         This is safe to use with concurrently executing tasks as each execution context has its own
         current task.
         """
-        return set_current_task(self)
+        return self.__current_task_ctx
+
+    def __as_current_task_now(self) -> typing.ContextManager[None]:
+        # Like `as_current_task`, but does nothing when this task already is the current task. The
+        # result depends on the current task at the time of the call, so this is only used where
+        # the context manager is entered right away.
+        if _current_task.get(None) is self:
+            return _already_current_task_ctx
+        return self.__current_task_ctx
 
     @contextmanager
     def block_finishing(self) -> typing.Iterator[None]:
@@ -877,7 +1092,7 @@ class Task:
 
 
 class RootTask(Task):
-    pass
+    __slots__ = ()
 
 
 class TaskAborted(Exception):
@@ -1009,10 +1224,66 @@ class TaskEvent:
         self.source.__emit_event__(self)
 
 
-@dataclass
-class TaskEventCursor(typing.Generic[T_TaskEvent]):
-    event: T_TaskEvent
-    tail: asyncio.Future[TaskEventCursor[T_TaskEvent]]
+_EVENT_BLOCK_SIZE = 64
+
+
+class _EventBlock(typing.Generic[T_TaskEvent]):
+    """A fixed size chunk of the events sent through an `_EventChannel`.
+
+    Blocks form a singly linked list that streams advance along, so blocks that all streams moved
+    past are freed automatically. The channel only references the last block, and it starts a new
+    one as soon as all streams consumed the events in it, so it does not keep delivered events
+    alive.
+    """
+
+    __slots__ = ("events", "next")
+
+    def __init__(self) -> None:
+        self.events: list[T_TaskEvent] = []
+        self.next: _EventBlock[T_TaskEvent] | None = None
+
+
+class _EventChannel(typing.Generic[T_TaskEvent]):
+    """Broadcasts events of a single type reaching a task to all `TaskEventStream` instances
+    obtained via `Task.events`."""
+
+    __slots__ = ("loop", "tail", "waiters", "streams", "closed")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.tail: _EventBlock[T_TaskEvent] = _EventBlock()
+        self.waiters: list[asyncio.Future[None]] = []
+        # Number of live `TaskEventStream` instances reading from this channel.
+        self.streams = 0
+        self.closed = False
+
+    def send(self, event: T_TaskEvent) -> None:
+        if self.closed or not self.streams:
+            # New streams start after the last sent event, so nothing would ever read this.
+            return
+        tail = self.tail
+        if tail.events and len(self.waiters) == self.streams:
+            # Every stream is waiting for a new event, so all of them have read all events of the
+            # tail. Leave them an empty block to move past instead of the delivered events.
+            tail.events = []
+            tail.next = tail = self.tail = _EventBlock()
+        elif len(tail.events) >= _EVENT_BLOCK_SIZE:
+            tail.next = tail = self.tail = _EventBlock()
+        tail.events.append(event)
+        self.__wake()
+
+    def close(self) -> None:
+        self.closed = True
+        self.__wake()
+
+    def __wake(self) -> None:
+        waiters = self.waiters
+        if not waiters:
+            return
+        self.waiters = []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
 
 
 class TaskEventStream(typing.AsyncIterator[T_TaskEvent]):
@@ -1023,35 +1294,62 @@ class TaskEventStream(typing.AsyncIterator[T_TaskEvent]):
     To handle events synchronously, use `Task.sync_handle_events` instead of this.
     """
 
-    __cursor: asyncio.Future[TaskEventCursor[T_TaskEvent]]
+    __slots__ = ("__channel", "__block", "__index", "__where")
+
+    __channel: _EventChannel[T_TaskEvent]
+    __block: _EventBlock[T_TaskEvent]
+    __index: int
     __where: Callable[[T_TaskEvent], bool]
 
     def __init__(
         self,
-        cursor: asyncio.Future[TaskEventCursor[T_TaskEvent]],
+        channel: _EventChannel[T_TaskEvent],
         where: Callable[[T_TaskEvent], bool],
     ):
-        self.__cursor = cursor
+        self.__channel = channel
+        self.__block = channel.tail
+        self.__index = len(channel.tail.events)
         self.__where = where
+        channel.streams += 1
+
+    def __del__(self) -> None:
+        self.__channel.streams -= 1
 
     def __aiter__(self) -> Self:
         return self
 
     async def __anext__(self) -> T_TaskEvent:
         while True:
+            block = self.__block
+            if self.__index < len(block.events):
+                result = block.events[self.__index]
+                self.__index += 1
+                if self.__where(result):
+                    return result
+                continue
+
+            if block.next is not None:
+                self.__block = block.next
+                self.__index = 0
+                continue
+
+            if self.__channel.closed:
+                raise StopAsyncIteration
+
+            channel = self.__channel
+            waiter: asyncio.Future[None] = channel.loop.create_future()
+            channel.waiters.append(waiter)
             try:
-                cursor = await self.__cursor
+                await waiter
             except asyncio.CancelledError:
+                # A waiter left behind would count as a stream that has read all events.
+                if waiter in channel.waiters:
+                    channel.waiters.remove(waiter)
                 aio_task = asyncio.current_task()
                 if aio_task and aio_task.done() and (aio_task.cancelled() or aio_task.exception()):
                     raise
                 raise StopAsyncIteration
 
-            result = cursor.event
-            self.__cursor = cursor.tail
-            if self.__where(result):
-                return result
-
     def process(
         self,
         handler: Callable[[Self], Awaitable[None]],
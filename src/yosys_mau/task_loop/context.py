@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import types
 from typing import Any, Generic, TypeVar
-from weakref import WeakKeyDictionary
 
-from ._task import Task, current_task_or_none
+from ._task import Task, _current_task
+
+# Equivalent to `current_task_or_none` when called with ``None``, but without the extra Python call
+# on every context variable access.
+_get_current_task = _current_task.get
 
 T = TypeVar("T")
 
@@ -26,60 +29,144 @@ class TaskContextDescriptor(Generic[T]):
 
     When reading the attribute, this performs a lookup in the task hierarchy, starting from the
     current task and going up to the root task. If no value is found the default value is returned.
+    The result is cached on the current task until the next assignment or deletion of the variable
+    in any task.
     """
 
-    __data: WeakKeyDictionary[Task, T]
-    __default: T
-    __owner: Any
-    __name: str | None
+    __slots__ = ("_default", "_attr_name", "_version", "_static_default")
+
+    _default: T | _MISSING_TYPE
+    _attr_name: str | None
+    _version: int
+    _static_default: bool
 
     def __init__(self, default: T | _MISSING_TYPE = MISSING) -> None:
-        self.__data = WeakKeyDictionary()
-        if default is not MISSING:
+        self._version = 0
+        # Subclasses overriding `default` may compute it dynamically, so it is neither accessed
+        # directly nor cached for them.
+        self._static_default = type(self).default is TaskContextDescriptor.default
+        if self._static_default or default is MISSING:
+            self._default = default
+        else:
+            self._default = MISSING
             self.default = default  # type: ignore
-        self.__owner = None
-        self.__name = None
+        self._attr_name = None
 
     def __set_name__(self, owner: type, name: str) -> None:
-        self.__owner = owner
-        self.__name = name
+        # The owner and name are fixed from here on, so the name used in error messages is built
+        # only once.
+        self._attr_name = f"{owner.__qualname__}.{name}"
 
     def __attr_name(self) -> str:
-        if self.__name is None:
-            return repr(self)
-        else:
-            return f"{self.__owner.__qualname__}.{self.__name}"
+        return self._attr_name or repr(self)
 
     def __get__(self, instance: Any, owner: type) -> T:
-        cursor = current_task_or_none()
+        task = _get_current_task(None)
+        if task is None:
+            return self.__get_default()
+
+        # Most reads find the value on the current task itself, so check it before setting up the
+        # walk. A value set directly on the task is as cheap to look up as a cache entry, so such
+        # hits are not cached.
+        version = self._version
+        cache = task._context_cache
+        if cache is not None:
+            entry = cache.get(self)
+            if entry is not None and entry[0] == version:
+                return entry[1]
+        values = task._context_values
+        if values is not None:
+            value = values.get(self, MISSING)
+            if value is not MISSING:
+                return value
+
+        cursor = task._parent
         while cursor is not None:
-            try:
-                return self.__data[cursor]
-            except KeyError:
-                cursor = cursor.parent
+            # A valid cache entry of an ancestor is as good as finding the value itself.
+            cache = cursor._context_cache
+            if cache is not None:
+                entry = cache.get(self)
+                if entry is not None and entry[0] == version:
+                    value = entry[1]
+                    break
+            values = cursor._context_values
+            if values is not None:
+                value = values.get(self, MISSING)
+                if value is not MISSING:
+                    break
+            cursor = cursor._parent
+        else:
+            value = self.__get_default()
+            if not self._static_default:
+                return value
+
+        # Every task we walked past resolves to the same value, so cache it for all of them. This
+        # walks the same path again instead of recording it, so a hit on the current task does not
+        # allocate anything.
+        entry = (version, value)
+        walked: Task | None = task
+        while walked is not cursor:
+            assert walked is not None
+            cache = walked._context_cache
+            if cache is None:
+                walked._context_cache = {self: entry}
+            else:
+                cache[self] = entry
+            walked = walked._parent
+        return value
+
+    def __get_default(self) -> T:
+        if self._static_default:
+            value = self._default
+            if value is MISSING:
+                raise AttributeError(f"Context variable {self.__attr_name()} not set")
+            return value  # type: ignore
         try:
             return self.default
         except AttributeError:
             raise AttributeError(f"Context variable {self.__attr_name()} not set") from None
 
     def __set__(self, instance: Any, value: T) -> None:
-        task = current_task_or_none()
+        task = _get_current_task(None)
         if task is None:
-            self.default = value
+            if self._static_default:
+                if self._default is not value:
+                    self._version += 1
+                    self._default = value
+            else:
+                self.default = value
         else:
-            self.__data[task] = value
+            values = task._context_values
+            if values is None:
+                values = task._context_values = {}
+            elif values.get(self, MISSING) is value:
+                # Cached lookups that resolved to the previous value are still valid, so there is
+                # nothing to invalidate.
+                return
+            self._version += 1
+            values[self] = value
 
     def __delete__(self, instance: Any) -> None:
-        task = current_task_or_none()
+        task = _get_current_task(None)
         if task is None:
+            if self._static_default:
+                if self._default is MISSING:
+                    raise AttributeError(f"Context variable {self.__attr_name()} not set")
+                self._version += 1
+                self._default = MISSING
+                return
             try:
                 del self.default
-            except KeyError:
+            except AttributeError:
+                raise AttributeError(f"Context variable {self.__attr_name()} not set") from None
+        else:
+            values = task._context_values
+            if not values or self not in values:
                 raise AttributeError(
                     f"Context variable {self.__attr_name()} not set for the current task"
-                ) from None
-        else:
-            del self.__data[task]
+                )
+            self._version += 1
+            del values[self]
 
     @property
     def default(self) -> T:
@@ -89,15 +176,21 @@ class TaskContextDescriptor(Generic[T]):
         dynamic behavior for the default value while retaining the same lookup and assignment
         behavior for values associated to tasks.
         """
-        return self.__default
+        if self._default is MISSING:
+            raise AttributeError("default")
+        return self._default  # type: ignore
 
     @default.setter
     def default(self, value: T) -> None:
-        self.__default = value
+        self._version += 1
+        self._default = value
 
     @default.deleter
     def default(self) -> None:
-        del self.__default
+        if self._default is MISSING:
+            raise AttributeError("default")
+        self._version += 1
+        self._default = MISSING
 
 
 class InlineContextVar(Generic[T]):
@@ -113,34 +206,62 @@ class InlineContextVar(Generic[T]):
     :param name: The name of the task context variable within this group.
     """
 
+    __descriptor: TaskContextDescriptor[T]
+
     def __init__(self, context_var_group: Any, name: str):
         self.__context = context_var_group
-        self.__name = name
+
+        descriptor = None
+        for cls in type(context_var_group).__mro__:
+            if name in cls.__dict__:
+                descriptor = cls.__dict__[name]
+                break
+        assert isinstance(descriptor, TaskContextDescriptor)
+        self.__descriptor = descriptor
 
     def __get__(self, instance: Any, owner: type) -> T:
+        descriptor = self.__descriptor
+        # Outside of a task loop there is no current task, so this also needs to rule out access
+        # through the class itself.
+        if instance is not None and _get_current_task(None) is instance:
+            return descriptor.__get__(self.__context, type(self.__context))
         with instance.as_current_task():
-            return getattr(self.__context, self.__name)
+            return descriptor.__get__(self.__context, type(self.__context))
 
     def __set__(self, instance: Any, value: T) -> None:
-        with instance.as_current_task():
-            setattr(self.__context, self.__name, value)
+        descriptor = self.__descriptor
+        if _get_current_task(None) is instance:
+            descriptor.__set__(self.__context, value)
+        else:
+            with instance.as_current_task():
+                descriptor.__set__(self.__context, value)
 
     def __delete__(self, instance: Any) -> None:
-        with instance.as_current_task():
-            delattr(self.__context, self.__name)
+        descriptor = self.__descriptor
+        if _get_current_task(None) is instance:
+            descriptor.__delete__(self.__context)
+        else:
+            with instance.as_current_task():
+                descriptor.__delete__(self.__context)
 
 
 def task_context_class(cls: type[T]) -> type[T]:
+    namespace = cls.__dict__
+    updates: dict[str, TaskContextDescriptor[Any]] = {}
     for name in getattr(cls, "__annotations__", ()):
-        try:
-            default_or_descriptor = cls.__dict__[name]
-        except KeyError:
-            setattr(cls, name, TaskContextDescriptor())
-        else:
-            if isinstance(default_or_descriptor, types.FunctionType) or not hasattr(
-                default_or_descriptor, "__get__"
-            ):
-                setattr(cls, name, TaskContextDescriptor(default_or_descriptor))
+        default_or_descriptor = namespace.get(name, MISSING)
+        if default_or_descriptor is MISSING:
+            updates[name] = TaskContextDescriptor()
+        elif (
+            isinstance(default_or_descriptor, types.FunctionType)
+            or getattr(default_or_descriptor, "__get__", None) is None
+        ):
+            updates[name] = TaskContextDescriptor(default_or_descriptor)
+
+    for name, descriptor in updates.items():
+        setattr(cls, name, descriptor)
+        # Assigning to a class attribute after class creation does not call this.
+        descriptor.__set_name__(cls, name)
     return cls
 
 
@@ -156,7 +277,9 @@ def task_context(cls: type[T]) -> T:
 
     cls = task_context_class(cls)
 
-    # This below is needed to make Sphinx happy, otherwise we could just return ``cls()``.
+    # This below is needed to make Sphinx happy, otherwise we could just return ``cls()``. The
+    # result is a class in all cases, so documentation builds and normal use behave the same and
+    # the group can still be subclassed.
     class AsMetaclass(cls, type):  # type: ignore
         pass
 
@@ -151,7 +151,7 @@ def test_no_default_value():
             order.append(SomeContext.some_var)
 
         def on_task2():
-            with pytest.raises(AttributeError):
+            with pytest.raises(AttributeError, match=r"SomeContext\.some_var not set"):
                 order.append(SomeContext.some_var)
 
             with tl.root_task().as_current_task():
@@ -205,4 +205,79 @@ def test_override_default():
     assert order == [1, 3, 3]
 
 
+def test_delete_local_override():
+    order: list[int] = []
+
+    @tl.task_context
+    class SomeContext:
+        some_var: int = 0
+
+    def main():
+        SomeContext.some_var = 1
+
+        def on_task1():
+            with pytest.raises(AttributeError):
+                del SomeContext.some_var
+
+            SomeContext.some_var = 2
+            order.append(SomeContext.some_var)
+            del SomeContext.some_var
+            order.append(SomeContext.some_var)
+
+        tl.Task(on_run=on_task1)
+
+    tl.run_task_loop(main)
+
+    assert order == [2, 1]
+
+
+def test_parent_update_after_read():
+    order: list[int] = []
+
+    @tl.task_context
+    class SomeContext:
+        some_var: int = 0
+
+    def main():
+        def on_task1():
+            child = tl.Task()
+
+            def read_in_child():
+                with child.as_current_task():
+                    order.append(SomeContext.some_var)
+
+            read_in_child()
+            SomeContext.some_var = 1
+            read_in_child()
+            read_in_child()
+            with tl.root_task().as_current_task():
+                SomeContext.some_var = 2
+            read_in_child()
+            del SomeContext.some_var
+            read_in_child()
+
+        tl.Task(on_run=on_task1)
+
+    tl.run_task_loop(main)
+
+    assert order == [0, 1, 1, 1, 2]
+
+
+def test_context_group_is_a_class():
+    @tl.task_context
+    class SomeContext:
+        some_var: int = 0
+
+    assert isinstance(SomeContext, type)
+
+    class DerivedContext(SomeContext):
+        pass
+
+    def main():
+        DerivedContext.some_var = 1
+        assert SomeContext.some_var == 1
+
+    tl.run_task_loop(main)
+
+
 # TODO tests
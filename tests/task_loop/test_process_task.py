@@ -157,6 +157,9 @@ def test_cwd():
 
     assert tl.process.ProcessContext.cwd == cwd
 
+    with pytest.raises(AttributeError):
+        tl.Process.cwd
+
     temp_dir = tempfile.TemporaryDirectory()
     temp_dir2 = tempfile.TemporaryDirectory()
 
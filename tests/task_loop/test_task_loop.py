@@ -5,6 +5,8 @@ import re
 import signal
 import subprocess
 import sys
+import weakref
+from dataclasses import dataclass
 
 import pytest
 import yosys_mau.task_loop as tl
@@ -187,6 +189,240 @@ def test_dependencies_handled_failure():
     assert len(handled) == 2
 
 
+def test_discard_unused_dependencies():
+    tasks: dict[str, tl.Task] = {}
+
+    def main():
+        tl.current_task().set_error_handler(None, lambda exc: None)
+
+        async def on_long():
+            await asyncio.sleep(10)
+
+        async def on_cancel():
+            await asyncio.sleep(0.01)
+            tasks["task3"].cancel()
+
+        tasks["task1"] = tl.Task(on_run=on_long)
+        tasks["task2"] = tl.Task(on_run=on_long)
+        tasks["task3"] = tl.Task()
+        tasks["task3"].depends_on(tasks["task1"])
+        tasks["task3"].depends_on(tasks["task2"])
+        tl.Task(on_run=on_cancel)
+
+    tl.run_task_loop(main)
+
+    assert [task.state for task in tasks.values()] == ["discarded", "discarded", "cancelled"]
+
+
+def test_await_finished_tasks():
+    checked: list[str] = []
+
+    def main():
+        def on_fail():
+            raise RuntimeError()
+
+        task1 = tl.Task(name="task1")
+        task2 = tl.Task(on_run=on_fail, name="task2")
+        task2.handle_error(lambda exc: None)
+
+        async def on_check():
+            await asyncio.sleep(0.01)
+            assert task1.is_done and task2.is_aborted
+
+            await task1.started
+            await task1.finished
+            checked.append("done")
+
+            await task2.started
+            with pytest.raises(tl.TaskFailed):
+                await task2.finished
+            checked.append("failed")
+
+        tl.Task(on_run=on_check)
+
+    tl.run_task_loop(main)
+
+    assert checked == ["done", "failed"]
+
+
+def test_as_current_task_nested_and_interleaved():
+    def main():
+        root = tl.current_task()
+        task1 = tl.Task()
+
+        with task1.as_current_task():
+            assert tl.current_task() is task1
+            with root.as_current_task():
+                assert tl.current_task() is root
+                with task1.as_current_task():
+                    assert tl.current_task() is task1
+                assert tl.current_task() is root
+            assert tl.current_task() is task1
+        assert tl.current_task() is root
+
+        first_entered = asyncio.Event()
+        second_entered = asyncio.Event()
+
+        async def first():
+            with task1.as_current_task():
+                first_entered.set()
+                await second_entered.wait()
+            assert tl.current_task() is root
+
+        async def second():
+            await first_entered.wait()
+            with task1.as_current_task():
+                second_entered.set()
+                await asyncio.sleep(0)
+                assert tl.current_task() is task1
+            assert tl.current_task() is root
+
+        root.background(first, wait=True)
+        root.background(second, wait=True)
+
+    tl.run_task_loop(main)
+
+
+def test_as_current_task_entered_later():
+    def main():
+        root = tl.current_task()
+        task1 = tl.Task()
+
+        with task1.as_current_task():
+            ctx = task1.as_current_task()
+
+        async def enter_later():
+            with ctx:
+                assert tl.current_task() is task1
+            assert tl.current_task() is root
+
+        root.background(enter_later, wait=True)
+
+    tl.run_task_loop(main)
+
+
+def test_event_streams():
+    @dataclass
+    class CountEvent(tl.TaskEvent):
+        value: int
+
+    received: list[list[int]] = [[], []]
+
+    def main():
+        def on_emitter():
+            for i in range(200):
+                CountEvent(i).emit()
+
+        emitter = tl.Task(on_run=on_emitter)
+
+        async def collect_all(stream: tl.TaskEventStream[CountEvent]):
+            async for event in stream:
+                received[0].append(event.value)
+
+        async def collect_odd(stream: tl.TaskEventStream[CountEvent]):
+            async for event in stream:
+                received[1].append(event.value)
+
+        emitter.events(CountEvent).process(collect_all)
+        emitter.events(CountEvent, where=lambda event: event.value % 2 == 1).process(collect_odd)
+
+    tl.run_task_loop(main)
+
+    assert received[0] == list(range(200))
+    assert received[1] == list(range(1, 200, 2))
+
+
+def test_event_streams_release_delivered_events():
+    @dataclass
+    class CountEvent(tl.TaskEvent):
+        value: int
+
+    refs: list[weakref.ref[CountEvent]] = []
+    released: list[bool] = []
+
+    def main():
+        async def on_emitter():
+            for i in range(3):
+                event = CountEvent(i)
+                refs.append(weakref.ref(event))
+                event.emit()
+                del event
+                await asyncio.sleep(0.01)
+
+        emitter = tl.Task(on_run=on_emitter)
+
+        async def collect(stream: tl.TaskEventStream[CountEvent]):
+            async for event in stream:
+                if event.value == 2:
+                    released.append(all(ref() is None for ref in refs[:2]))
+
+        emitter.events(CountEvent).process(collect)
+
+    tl.run_task_loop(main)
+
+    assert released == [True]
+
+
+def test_state_change_events():
+    states: list[tuple[str | None, str]] = []
+
+    def main():
+        def on_state_change(event: tl.TaskStateChange):
+            if event.source.name == "child":
+                states.append((event.previous_state, event.state))
+
+        tl.current_task().sync_handle_events(tl.TaskStateChange, on_state_change)
+        tl.Task(name="child")
+
+    tl.run_task_loop(main)
+
+    assert states == [
+        (None, "preparing"),
+        ("preparing", "pending"),
+        ("pending", "running"),
+        ("running", "waiting"),
+        ("waiting", "done"),
+    ]
+
+
+def test_task_paths():
+    def main():
+        def on_parent():
+            child = tl.Task(name="child")
+            assert child.path == "parent.child"
+            assert str(child) == "parent.child"
+
+            parent.name = "renamed"
+            assert child.path == "renamed.child"
+
+            child.name = "other"
+            assert child.path == "renamed.other"
+
+        parent = tl.Task(on_run=on_parent, name="parent")
+        assert parent.path == "parent"
+        assert tl.current_task().path == "root"
+
+    tl.run_task_loop(main)
+
+
+def test_unique_task_names():
+    def main():
+        tasks = [tl.Task(name="task") for _ in range(4)]
+        assert [task.name for task in tasks] == ["task", "task#1", "task#2", "task#3"]
+
+        tasks[2].name = "other"
+        assert tl.Task(name="task").name == "task#2"
+        assert tl.Task(name="task").name == "task#4"
+        assert tl.Task(name="other").name == "other#1"
+
+        # Renaming tasks with names that the suffix generation never produces leaves it unaffected.
+        for name in ["task#0", "task#05", "task#\u00b2"]:
+            tl.Task(name=name).name = "renamed"
+        assert tl.Task(name="task").name == "task#5"
+
+    tl.run_task_loop(main)
+
+
 def test_sigint():
     process = subprocess.Popen(
         [sys.executable, __file__, inner_sigint.__name__],